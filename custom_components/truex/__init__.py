@@ -19,6 +19,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -32,6 +33,8 @@ from .const import (
     LOGGER,
     PLATFORMS,
     POLL_INTERVAL,
+    SPEC_STORAGE_VERSION,
+    SUPPORTED_CATEGORIES,
 )
 
 # Suppress overly verbose logs
@@ -66,6 +69,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> boo
 
     # Create API client
     api = CustomerApi(api_url, client_id, secret, schema)
+    # Close the session on unload and on any failed setup attempt
+    entry.async_on_unload(api.close)
 
     # Restore token if available
     if token_data:
@@ -75,7 +80,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> boo
     try:
         await api.get_access_token()
     except TrueXAPIError as exc:
-        await api.close()
         raise ConfigEntryAuthFailed(
             f"Authentication failed: {exc}"
         ) from exc
@@ -83,18 +87,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> boo
     # Save refreshed token back
     _update_token_in_entry(hass, entry, api)
 
-    # Create device manager
-    manager = Manager(api, uid)
+    # Create device manager, seeded with specifications cached on disk
+    spec_store = _spec_store(hass, entry)
+    spec_cache: dict[str, dict[str, Any]] = await spec_store.async_load() or {}
+    manager = Manager(api, uid, spec_cache)
+    entry.async_on_unload(manager.cancel_refreshes)
 
     # Fetch initial device cache
     try:
-        await manager.update_device_cache()
+        await manager.update_device_cache(SUPPORTED_CATEGORIES)
     except Exception as exc:
-        await api.close()
         raise ConfigEntryAuthFailed(
             f"Failed to fetch devices: {exc}"
         ) from exc
 
+    if manager.spec_cache_changed:
+        await spec_store.async_save(manager.spec_cache)
+
     # Create polling coordinator
     async def _async_update_data() -> dict[str, Any]:
         """Poll device status."""
@@ -121,20 +130,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> boo
 
     # Register devices in the device registry
     device_registry = dr.async_get(hass)
-    for device in manager.device_map.values():
-        LOGGER.debug(
-            "Register device %s (online: %s, category: %s): status=%s",
-            device.id,
-            device.online,
-            device.category,
-            device.status,
+    register = device_registry.async_get_or_create
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
+    # Known devices as (identifier -> (name, model, model_id)) for this entry
+    registered = {
+        identifier: (
+            device_entry.name,
+            device_entry.model,
+            device_entry.model_id,
         )
-        device_registry.async_get_or_create(
+        for device_entry in dr.async_entries_for_config_entry(
+            device_registry, entry.entry_id
+        )
+        for domain, identifier in device_entry.identifiers
+        if domain == DOMAIN
+    }
+    for device in manager.device_map.values():
+        model = device.product_name or device.category
+        if registered.get(device.id) == (device.name, model, device.product_id):
+            continue
+        if debug:
+            LOGGER.debug(
+                "Register device %s (online: %s, category: %s): %d status codes",
+                device.id,
+                device.online,
+                device.category,
+                len(device.status),
+            )
+        register(
             config_entry_id=entry.entry_id,
             identifiers={(DOMAIN, device.id)},
             manufacturer="TrueDigital",
             name=device.name,
-            model=device.product_name or device.category,
+            model=model,
             model_id=device.product_id,
         )
 
@@ -145,15 +173,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> boo
 
 async def async_unload_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> bool:
     """Unload a TrueX config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        truex_data = entry.runtime_data
-        await truex_data.api.close()
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: TrueXConfigEntry) -> None:
+    """Remove the stored specification cache of a deleted entry."""
+    await _spec_store(hass, entry).async_remove()
+
+
+def _spec_store(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Store[dict[str, dict[str, Any]]]:
+    """Return the storage holding cached device specifications for an entry."""
+    return Store(hass, SPEC_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.specs")
 
 
 def _update_token_in_entry(
     hass: HomeAssistant, entry: ConfigEntry, api: CustomerApi
 ) -> None:
-    """Save the current token info back to the config entry."""
-    new_data = {**entry.data, CONF_TOKEN_INFO: api.token_info.to_dict()}
+    """Save the current token info back to the config entry.
+
+    Skipped when the token is unchanged, which is the case for almost
+    every poll, so the config entries file is not rewritten needlessly.
+    """
+    new_token = api.token_info.to_dict()
+    if entry.data.get(CONF_TOKEN_INFO) == new_token:
+        return
+    new_data = dict(entry.data)
+    new_data[CONF_TOKEN_INFO] = new_token
     hass.config_entries.async_update_entry(entry, data=new_data)
@@ -104,6 +104,15 @@ BINARY_SENSORS: dict[str, list[TrueXBinarySensorDescription]] = {
     ],
 }
 
+# Per-category dpcode set alongside its descriptions, built once at import.
+# Dpcodes are stored as plain strings so lookups skip the StrEnum layer.
+_BINARY_SENSOR_INDEX: dict[
+    str, tuple[frozenset[str], list[TrueXBinarySensorDescription]]
+] = {
+    category: (frozenset(str(d.dpcode) for d in descriptions), descriptions)
+    for category, descriptions in BINARY_SENSORS.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -117,17 +126,20 @@ async def async_setup_entry(
 
     entities: list[TrueXBinarySensorEntity] = []
 
-    for device in manager.device_map.values():
-        if device.category not in BINARY_SENSORS:
-            continue
-        for description in BINARY_SENSORS[device.category]:
-            if (
-                description.dpcode in device.status
-                or description.dpcode in device.status_range
-            ):
-                entities.append(
-                    TrueXBinarySensorEntity(coordinator, device, manager, description)
-                )
+    for category, (dpcodes, descriptions) in _BINARY_SENSOR_INDEX.items():
+        for device in manager.devices_by_category.get(category, ()):
+            present = dpcodes.intersection(device.status) | dpcodes.intersection(
+                device.status_range
+            )
+            if not present:
+                continue
+            for description in descriptions:
+                if description.dpcode in present:
+                    entities.append(
+                        TrueXBinarySensorEntity(
+                            coordinator, device, manager, description
+                        )
+                    )
 
     LOGGER.debug("Setting up %d binary sensor entities", len(entities))
     async_add_entities(entities)
@@ -149,11 +161,14 @@ class TrueXBinarySensorEntity(TrueXEntity, BinarySensorEntity):
         super().__init__(coordinator, device, device_manager)
         self.entity_description = description
         self._attr_unique_id = f"truex.{device.id}.{description.key}"
+        self._dpcode = str(description.dpcode)
+        self._on_value = description.on_value
 
     @property
     def is_on(self) -> bool | None:
         """Return true if sensor is on / triggered."""
-        value = self.device_obj.status.get(self.entity_description.dpcode)
+        value = self.device_obj.status.get(self._dpcode)
         if value is None:
             return None
-        return value == self.entity_description.on_value
+        # Identity first: JSON booleans and short codes are shared objects
+        return value is self._on_value or value == self._on_value
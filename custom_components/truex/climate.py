@@ -38,6 +38,14 @@ TUYA_MODE_TO_HVAC: dict[str, HVACMode] = {
 
 HVAC_TO_TUYA_MODE: dict[HVACMode, str] = {v: k for k, v in TUYA_MODE_TO_HVAC.items()}
 
+# Plain-string dpcodes for the status lookups done on every state read
+_SWITCH = str(DPCode.SWITCH)
+_MODE = str(DPCode.MODE)
+_TEMP_CURRENT = str(DPCode.TEMP_CURRENT)
+_TEMP_SET = str(DPCode.TEMP_SET)
+_FAN_SPEED = str(DPCode.FAN_SPEED_ENUM)
+_HUMIDITY_CURRENT = str(DPCode.HUMIDITY_CURRENT)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,13 +59,15 @@ async def async_setup_entry(
 
     entities: list[TrueXClimateEntity] = []
 
-    for device in manager.device_map.values():
-        if device.category not in CLIMATE_CATEGORIES:
-            continue
-        # Must have at least a switch dpcode
-        if DPCode.SWITCH not in device.status and DPCode.SWITCH not in device.functions:
-            continue
-        entities.append(TrueXClimateEntity(coordinator, device, manager))
+    for category in CLIMATE_CATEGORIES:
+        for device in manager.devices_by_category.get(category, ()):
+            # Must have at least a switch dpcode
+            if (
+                DPCode.SWITCH not in device.status
+                and DPCode.SWITCH not in device.functions
+            ):
+                continue
+            entities.append(TrueXClimateEntity(coordinator, device, manager))
 
     LOGGER.debug("Setting up %d climate entities", len(entities))
     async_add_entities(entities)
@@ -80,19 +90,16 @@ class TrueXClimateEntity(TrueXEntity, ClimateEntity):
 
         # Determine features
         features = ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-        if DPCode.TEMP_SET in device.functions or DPCode.TEMP_SET in device.status:
+        if _TEMP_SET in device.functions or _TEMP_SET in device.status:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE
-        if (
-            DPCode.FAN_SPEED_ENUM in device.functions
-            or DPCode.FAN_SPEED_ENUM in device.status
-        ):
+        if _FAN_SPEED in device.functions or _FAN_SPEED in device.status:
             features |= ClimateEntityFeature.FAN_MODE
         self._attr_supported_features = features
 
         # HVAC modes
         modes = [HVACMode.OFF]
-        if DPCode.MODE in device.functions:
-            mode_values = device.functions[DPCode.MODE].get("values", {})
+        if _MODE in device.functions:
+            mode_values = device.functions[_MODE]["values"]
             mode_range = mode_values.get("range", [])
             for tuya_mode in mode_range:
                 if tuya_mode in TUYA_MODE_TO_HVAC:
@@ -103,16 +110,16 @@ class TrueXClimateEntity(TrueXEntity, ClimateEntity):
         self._attr_hvac_modes = modes
 
         # Fan modes
-        if DPCode.FAN_SPEED_ENUM in device.functions:
-            fan_values = device.functions[DPCode.FAN_SPEED_ENUM].get("values", {})
-            self._attr_fan_modes = fan_values.get("range", ["low", "mid", "high"])
-        elif DPCode.FAN_SPEED_ENUM in device.status_range:
-            fan_values = device.status_range[DPCode.FAN_SPEED_ENUM].get("values", {})
+        fan_spec = device.functions.get(_FAN_SPEED) or device.status_range.get(
+            _FAN_SPEED
+        )
+        if fan_spec is not None:
+            fan_values = fan_spec["values"]
             self._attr_fan_modes = fan_values.get("range", ["low", "mid", "high"])
 
         # Temperature range
-        if DPCode.TEMP_SET in device.functions:
-            temp_values = device.functions[DPCode.TEMP_SET].get("values", {})
+        if _TEMP_SET in device.functions:
+            temp_values = device.functions[_TEMP_SET]["values"]
             self._attr_min_temp = temp_values.get("min", 16)
             self._attr_max_temp = temp_values.get("max", 30)
             self._attr_target_temperature_step = temp_values.get("step", 1)
@@ -120,50 +127,44 @@ class TrueXClimateEntity(TrueXEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return the current HVAC mode."""
-        switch_on = self.device_obj.status.get(DPCode.SWITCH)
+        switch_on = self.device_obj.status.get(_SWITCH)
         if not switch_on:
             return HVACMode.OFF
 
-        mode = self.device_obj.status.get(DPCode.MODE, "")
+        mode = self.device_obj.status.get(_MODE, "")
         return TUYA_MODE_TO_HVAC.get(mode, HVACMode.AUTO)
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        value = self.device_obj.status.get(DPCode.TEMP_CURRENT)
+    @staticmethod
+    def _coerce_num(
+        value: Any, cast: type[float] | type[int]
+    ) -> float | int | None:
+        """Cast a raw status value to a number, or None if it is not one."""
         if value is None:
             return None
         try:
-            return float(value)
+            return cast(value)
         except (ValueError, TypeError):
             return None
 
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the current temperature."""
+        return self._coerce_num(self.device_obj.status.get(_TEMP_CURRENT), float)
+
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        value = self.device_obj.status.get(DPCode.TEMP_SET)
-        if value is None:
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        return self._coerce_num(self.device_obj.status.get(_TEMP_SET), float)
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode."""
-        return self.device_obj.status.get(DPCode.FAN_SPEED_ENUM)
+        return self.device_obj.status.get(_FAN_SPEED)
 
     @property
     def current_humidity(self) -> int | None:
         """Return current humidity."""
-        value = self.device_obj.status.get(DPCode.HUMIDITY_CURRENT)
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None
+        return self._coerce_num(self.device_obj.status.get(_HUMIDITY_CURRENT), int)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
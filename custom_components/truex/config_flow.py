@@ -9,6 +9,7 @@ from .truex_sharing import CustomerApi, TrueXAPIError
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.core import callback
 
 from .const import (
     CONF_API_URL,
@@ -28,6 +29,36 @@ class TrueXConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._validator: CustomerApi | None = None
+        self._validator_key: tuple[str, str, str, str] | None = None
+
+    async def _async_get_validator(
+        self, api_url: str, client_id: str, secret: str, schema: str
+    ) -> CustomerApi:
+        """Return a validation client, reusing it while credentials are unchanged."""
+        key = (api_url, client_id, secret, schema)
+        if self._validator is None or self._validator_key != key:
+            if self._validator is not None:
+                await self._validator.close()
+            self._validator = CustomerApi(api_url, client_id, secret, schema)
+            self._validator_key = key
+        return self._validator
+
+    async def _async_close_validator(self) -> None:
+        """Close the validation client, if any."""
+        if self._validator is not None:
+            await self._validator.close()
+            self._validator = None
+            self._validator_key = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the validation client when the flow goes away."""
+        if self._validator is not None:
+            self.hass.async_create_task(self._async_close_validator())
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -41,8 +72,10 @@ class TrueXConfigFlow(ConfigFlow, domain=DOMAIN):
             schema = user_input[CONF_SCHEMA]
             username = user_input[CONF_USERNAME]
 
-            # Validate credentials
-            api = CustomerApi(api_url, client_id, secret, schema)
+            # Validate credentials, keeping the connection across retries
+            api = await self._async_get_validator(
+                api_url, client_id, secret, schema
+            )
             try:
                 # Step 1: Get access token
                 await api.get_access_token()
@@ -74,6 +107,7 @@ class TrueXConfigFlow(ConfigFlow, domain=DOMAIN):
                                 CONF_UID: uid,
                                 CONF_TOKEN_INFO: api.token_info.to_dict(),
                             }
+                            await self._async_close_validator()
                             return self.async_create_entry(
                                 title=f"TrueX ({username})",
                                 data=entry_data,
@@ -85,8 +119,6 @@ class TrueXConfigFlow(ConfigFlow, domain=DOMAIN):
             except Exception:
                 LOGGER.exception("Unexpected error during setup")
                 errors["base"] = "unknown"
-            finally:
-                await api.close()
 
         return self.async_show_form(
             step_id="user",
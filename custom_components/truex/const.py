@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from enum import StrEnum
 import logging
+from typing import Final
 
 from homeassistant.const import Platform
 
@@ -19,6 +20,9 @@ CONF_USERNAME = "username"
 CONF_TOKEN_INFO = "token_info"
 CONF_UID = "uid"
 
+# Storage version of the per-entry device specification cache
+SPEC_STORAGE_VERSION = 1
+
 # Signals
 TRUEX_DISCOVERY_NEW = "truex_discovery_new"
 TRUEX_HA_SIGNAL_UPDATE_ENTITY = "truex_entry_update"
@@ -26,14 +30,18 @@ TRUEX_HA_SIGNAL_UPDATE_ENTITY = "truex_entry_update"
 # Polling interval in seconds
 POLL_INTERVAL = 30
 
-PLATFORMS = [
+# Quiet period in seconds after the last command to a device before its
+# status is re-read; commands sent within it share a single refresh
+REFRESH_COOLDOWN = 1.0
+
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
     Platform.COVER,
     Platform.LIGHT,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
 
 
 class DPCode(StrEnum):
@@ -190,3 +198,46 @@ class DeviceCategory(StrEnum):
     """Garage door opener"""
     MC = "mc"
     """Door/window controller"""
+
+
+# Categories handled by at least one platform; specs are only fetched for
+# these. Keep in step with the platforms' category tables.
+SUPPORTED_CATEGORIES: Final[frozenset[str]] = frozenset(
+    {
+        # switch
+        DeviceCategory.KG,
+        DeviceCategory.CZ,
+        DeviceCategory.PC,
+        DeviceCategory.DLQ,
+        # light
+        DeviceCategory.DJ,
+        DeviceCategory.XDD,
+        DeviceCategory.FWD,
+        DeviceCategory.DC,
+        DeviceCategory.DD,
+        DeviceCategory.TGKG,
+        DeviceCategory.TGQ,
+        DeviceCategory.FSD,
+        # sensor
+        DeviceCategory.WSDCG,
+        DeviceCategory.CO2BJ,
+        DeviceCategory.ZNDB,
+        DeviceCategory.HJJCY,
+        # climate
+        DeviceCategory.KT,
+        DeviceCategory.WK,
+        DeviceCategory.KTKZQ,
+        # binary_sensor
+        DeviceCategory.MCS,
+        DeviceCategory.PIR_CAT,
+        DeviceCategory.SJ,
+        DeviceCategory.YWBJ,
+        DeviceCategory.RQBJ,
+        DeviceCategory.COBJ,
+        # cover
+        DeviceCategory.CL,
+        DeviceCategory.CLKG,
+        DeviceCategory.CKMKZQ,
+        DeviceCategory.MC,
+    }
+)
@@ -18,7 +18,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import TrueXConfigEntry
 from .const import DPCode, DeviceCategory, LOGGER
-from .entity import TrueXEntity
+from .entity import TrueXEntity, status_cached
 
 # Categories and their cover device classes
 COVER_CATEGORIES: dict[str, CoverDeviceClass] = {
@@ -28,6 +28,17 @@ COVER_CATEGORIES: dict[str, CoverDeviceClass] = {
     DeviceCategory.MC: CoverDeviceClass.DOOR,
 }
 
+# Position DPCodes, in priority order
+POSITION_DPCODES = (DPCode.PERCENT_STATE, DPCode.POSITION, DPCode.PERCENT_CONTROL)
+
+# Position DPCodes that report where the cover is, not the commanded target
+MEASURED_POSITION_DPCODES = frozenset({DPCode.PERCENT_STATE, DPCode.POSITION})
+
+# Fixed command payloads, shared by every cover (never mutated)
+_CMD_OPEN: tuple[dict[str, Any], ...] = ({"code": DPCode.CONTROL, "value": "open"},)
+_CMD_CLOSE: tuple[dict[str, Any], ...] = ({"code": DPCode.CONTROL, "value": "close"},)
+_CMD_STOP: tuple[dict[str, Any], ...] = ({"code": DPCode.CONTROL, "value": "stop"},)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,23 +52,17 @@ async def async_setup_entry(
 
     entities: list[TrueXCoverEntity] = []
 
-    for device in manager.device_map.values():
-        if device.category not in COVER_CATEGORIES:
-            continue
-        # Must have at least a control dpcode
-        if (
-            DPCode.CONTROL not in device.status
-            and DPCode.CONTROL not in device.functions
-        ):
-            continue
-        entities.append(
-            TrueXCoverEntity(
-                coordinator,
-                device,
-                manager,
-                COVER_CATEGORIES[device.category],
+    for category, device_class in COVER_CATEGORIES.items():
+        for device in manager.devices_by_category.get(category, ()):
+            # Must have at least a control dpcode
+            if (
+                DPCode.CONTROL not in device.status
+                and DPCode.CONTROL not in device.functions
+            ):
+                continue
+            entities.append(
+                TrueXCoverEntity(coordinator, device, manager, device_class)
             )
-        )
 
     LOGGER.debug("Setting up %d cover entities", len(entities))
     async_add_entities(entities)
@@ -90,7 +95,20 @@ class TrueXCoverEntity(TrueXEntity, CoverEntity):
             features |= CoverEntityFeature.SET_POSITION
         self._attr_supported_features = features
 
+        # Position is read from the first dpcode this device exposes
+        self._pos_dpcode = next(
+            (
+                dpcode
+                for dpcode in POSITION_DPCODES
+                if dpcode in device.status or dpcode in device.functions
+            ),
+            None,
+        )
+        # Open/close may only be skipped when the position is measured
+        self._pos_is_measured = self._pos_dpcode in MEASURED_POSITION_DPCODES
+
     @property
+    @status_cached
     def is_closed(self) -> bool | None:
         """Return if the cover is closed."""
         # Check control state
@@ -107,32 +125,40 @@ class TrueXCoverEntity(TrueXEntity, CoverEntity):
         return None
 
     @property
+    @status_cached
     def current_cover_position(self) -> int | None:
         """Return current cover position (0-100)."""
         return self._get_position()
 
     def _get_position(self) -> int | None:
-        """Get position from available DPCodes."""
-        for dpcode in (DPCode.PERCENT_STATE, DPCode.POSITION, DPCode.PERCENT_CONTROL):
-            value = self.device_obj.status.get(dpcode)
-            if value is not None:
-                try:
-                    return int(value)
-                except (ValueError, TypeError):
-                    continue
-        return None
+        """Get position from the resolved position DPCode."""
+        if self._pos_dpcode is None:
+            return None
+        value = self.device_obj.status.get(self._pos_dpcode)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self._send_commands([{"code": DPCode.CONTROL, "value": "open"}])
+        # Skip only when the measured position says it is fully open;
+        # control and percent_control merely echo the last command sent
+        if self._pos_is_measured and self.current_cover_position == 100:
+            return
+        await self._send_commands(list(_CMD_OPEN))
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        await self._send_commands([{"code": DPCode.CONTROL, "value": "close"}])
+        if self._pos_is_measured and self.current_cover_position == 0:
+            return
+        await self._send_commands(list(_CMD_CLOSE))
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        await self._send_commands([{"code": DPCode.CONTROL, "value": "stop"}])
+        await self._send_commands(list(_CMD_STOP))
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set cover position."""
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
 
 from .truex_sharing import CustomerDevice, Manager
 
@@ -12,7 +14,31 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, REFRESH_COOLDOWN
+
+_EntityT = TypeVar("_EntityT", bound="TrueXEntity")
+_R = TypeVar("_R")
+
+
+def status_cached(func: Callable[[_EntityT], _R]) -> Callable[[_EntityT], _R]:
+    """Memoize a state getter until the device reports a new status.
+
+    Wrap with ``@property`` on the outside. The result is recomputed
+    only when the device's ``status_version`` changes.
+    """
+    cache_attr = f"_status_cache_{func.__name__}"
+
+    @wraps(func)
+    def wrapper(self: _EntityT) -> _R:
+        version = self.device_obj.status_version
+        cached = self.__dict__.get(cache_attr)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = func(self)
+        self.__dict__[cache_attr] = (version, value)
+        return value
+
+    return wrapper
 
 
 class TrueXEntity(CoordinatorEntity):
@@ -54,5 +80,11 @@ class TrueXEntity(CoordinatorEntity):
         if not commands:
             return
         await self.device_manager.send_commands(self.device_obj.id, commands)
-        # Request a coordinator refresh to update the state
-        await self.coordinator.async_request_refresh()
+        # Re-read only this device once its burst of commands settles, then
+        # update every entity listening to the coordinator (siblings on the
+        # same device included); the service call does not wait for it
+        self.device_manager.schedule_refresh(
+            self.device_obj.id,
+            REFRESH_COOLDOWN,
+            self.coordinator.async_update_listeners,
+        )
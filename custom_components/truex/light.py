@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable, Set as AbstractSet
+from functools import partial
 from typing import Any
 
 from .truex_sharing import CustomerDevice, Manager
@@ -16,11 +17,12 @@ from homeassistant.components.light import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import TrueXConfigEntry
 from .const import DPCode, DeviceCategory, LOGGER
-from .entity import TrueXEntity
+from .entity import TrueXEntity, status_cached
 
 # Categories that produce light entities
 LIGHT_CATEGORIES: set[str] = {
@@ -59,6 +61,32 @@ MIN_KELVIN = 2700
 MAX_KELVIN = 6500
 
 
+def _first_available(dpcodes: list[str], avail: AbstractSet[str]) -> str | None:
+    """Return the first dpcode from a list that the device exposes."""
+    return next((dpcode for dpcode in dpcodes if dpcode in avail), None)
+
+
+def _linear_scaler(
+    from_min: float, from_max: float, to_min: float, to_max: float
+) -> Callable[[float], int]:
+    """Build a function scaling a value from one range to another.
+
+    The range spans are computed once; the returned function clamps
+    its result to the target range.
+    """
+    if from_max == from_min:
+        fixed = int(to_min)
+        return lambda value: fixed
+    from_span = from_max - from_min
+    to_span = to_max - to_min
+
+    def scale(value: float) -> int:
+        scaled = (value - from_min) / from_span * to_span + to_min
+        return int(max(to_min, min(to_max, scaled)))
+
+    return scale
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: TrueXConfigEntry,
@@ -71,10 +99,9 @@ async def async_setup_entry(
 
     entities: list[TrueXLightEntity] = []
 
-    for device in manager.device_map.values():
-        if device.category not in LIGHT_CATEGORIES:
-            continue
-        entities.append(TrueXLightEntity(coordinator, device, manager))
+    for category in LIGHT_CATEGORIES:
+        for device in manager.devices_by_category.get(category, ()):
+            entities.append(TrueXLightEntity(coordinator, device, manager))
 
     LOGGER.debug("Setting up %d light entities", len(entities))
     async_add_entities(entities)
@@ -93,14 +120,13 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         super().__init__(coordinator, device, device_manager)
 
         # Determine which DPCodes this light supports
-        self._switch_dpcode = self._find_dpcode(LIGHT_SWITCH_DPCODES)
-        self._brightness_dpcode = self._find_dpcode(BRIGHTNESS_DPCODES)
-        self._color_temp_dpcode = self._find_dpcode(COLOR_TEMP_DPCODES)
-        self._color_data_dpcode = self._find_dpcode(COLOR_DATA_DPCODES)
+        avail = device.status.keys() | device.functions.keys()
+        self._switch_dpcode = _first_available(LIGHT_SWITCH_DPCODES, avail)
+        self._brightness_dpcode = _first_available(BRIGHTNESS_DPCODES, avail)
+        self._color_temp_dpcode = _first_available(COLOR_TEMP_DPCODES, avail)
+        self._color_data_dpcode = _first_available(COLOR_DATA_DPCODES, avail)
         self._work_mode_dpcode = (
-            DPCode.WORK_MODE
-            if DPCode.WORK_MODE in device.status or DPCode.WORK_MODE in device.functions
-            else None
+            DPCode.WORK_MODE if DPCode.WORK_MODE in avail else None
         )
 
         # Determine supported color modes
@@ -125,7 +151,7 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         self._bright_min = DEFAULT_BRIGHT_MIN
         self._bright_max = DEFAULT_BRIGHT_MAX
         if self._brightness_dpcode and self._brightness_dpcode in device.functions:
-            func_values = device.functions[self._brightness_dpcode].get("values", {})
+            func_values = device.functions[self._brightness_dpcode]["values"]
             self._bright_min = func_values.get("min", DEFAULT_BRIGHT_MIN)
             self._bright_max = func_values.get("max", DEFAULT_BRIGHT_MAX)
 
@@ -133,16 +159,23 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         self._temp_min = DEFAULT_TEMP_MIN
         self._temp_max = DEFAULT_TEMP_MAX
         if self._color_temp_dpcode and self._color_temp_dpcode in device.functions:
-            func_values = device.functions[self._color_temp_dpcode].get("values", {})
+            func_values = device.functions[self._color_temp_dpcode]["values"]
             self._temp_min = func_values.get("min", DEFAULT_TEMP_MIN)
             self._temp_max = func_values.get("max", DEFAULT_TEMP_MAX)
 
-    def _find_dpcode(self, dpcodes: list[str]) -> str | None:
-        """Find the first available dpcode from a list."""
-        for dpcode in dpcodes:
-            if dpcode in self.device_obj.status or dpcode in self.device_obj.functions:
-                return dpcode
-        return None
+        # Ranges are fixed from here on, so prebuild the conversions
+        self._bright_to_hass = _linear_scaler(
+            self._bright_min, self._bright_max, 0, 255
+        )
+        self._bright_to_device = _linear_scaler(
+            0, 255, self._bright_min, self._bright_max
+        )
+        self._temp_to_kelvin = _linear_scaler(
+            self._temp_min, self._temp_max, MIN_KELVIN, MAX_KELVIN
+        )
+        self._kelvin_to_temp = _linear_scaler(
+            MIN_KELVIN, MAX_KELVIN, self._temp_min, self._temp_max
+        )
 
     @property
     def is_on(self) -> bool | None:
@@ -154,6 +187,7 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         return None
 
     @property
+    @status_cached
     def brightness(self) -> int | None:
         """Return the brightness 0-255."""
         if not self._brightness_dpcode:
@@ -162,7 +196,7 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         if value is None:
             return None
         # Scale from device range to 0-255
-        return self._scale(int(value), self._bright_min, self._bright_max, 0, 255)
+        return self._bright_to_hass(int(value))
 
     @property
     def color_temp_kelvin(self) -> int | None:
@@ -173,35 +207,30 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         if value is None:
             return None
         # Scale from device range to Kelvin range
-        return self._scale(
-            int(value),
-            self._temp_min, self._temp_max,
-            MIN_KELVIN, MAX_KELVIN,
-        )
+        return self._temp_to_kelvin(int(value))
 
     @property
+    @status_cached
     def hs_color(self) -> tuple[float, float] | None:
         """Return the HS color."""
         if not self._color_data_dpcode:
             return None
-        raw = self.device_obj.status.get(self._color_data_dpcode)
-        if not raw:
+        # Colour data is decoded from JSON by the manager on ingestion
+        color_data = self.device_obj.status.get(self._color_data_dpcode)
+        if not color_data or not isinstance(color_data, dict):
             return None
+        h = color_data.get("h", 0)
+        s = color_data.get("s", 0)
+        # s is typically 0-1000 or 0-255, scale to 0-100
+        s_max = 1000 if self._color_data_dpcode == DPCode.COLOUR_DATA_V2 else 255
         try:
-            if isinstance(raw, str):
-                color_data = json.loads(raw)
-            else:
-                color_data = raw
-            h = color_data.get("h", 0)
-            s = color_data.get("s", 0)
-            # s is typically 0-1000 or 0-255, scale to 0-100
-            s_max = 1000 if self._color_data_dpcode == DPCode.COLOUR_DATA_V2 else 255
             s_pct = (s / s_max) * 100
-            return (h, s_pct)
-        except (json.JSONDecodeError, TypeError, KeyError):
+        except TypeError:
             return None
+        return (h, s_pct)
 
     @property
+    @status_cached
     def color_mode(self) -> ColorMode | None:
         """Return the current color mode."""
         if not self._attr_supported_color_modes:
@@ -230,34 +259,29 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
         return ColorMode.ONOFF
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on."""
+        """Turn the light on.
+
+        Only values that differ from the last reported state are sent.
+        """
         commands: list[dict[str, Any]] = []
+        _set = partial(self._queue_command, commands)
 
         if self._switch_dpcode:
-            commands.append({"code": self._switch_dpcode, "value": True})
+            _set(self._switch_dpcode, True)
 
         # Handle brightness
         if ATTR_BRIGHTNESS in kwargs and self._brightness_dpcode:
             brightness = kwargs[ATTR_BRIGHTNESS]
-            device_brightness = self._scale(
-                brightness, 0, 255, self._bright_min, self._bright_max
-            )
-            commands.append(
-                {"code": self._brightness_dpcode,
-                 "value": device_brightness}
-            )
+            _set(self._brightness_dpcode, self._bright_to_device(brightness))
             if self._work_mode_dpcode:
-                commands.append({"code": self._work_mode_dpcode, "value": "white"})
+                _set(self._work_mode_dpcode, "white")
 
         # Handle color temperature
         if ATTR_COLOR_TEMP_KELVIN in kwargs and self._color_temp_dpcode:
             kelvin = kwargs[ATTR_COLOR_TEMP_KELVIN]
-            device_temp = self._scale(
-                kelvin, MIN_KELVIN, MAX_KELVIN, self._temp_min, self._temp_max
-            )
-            commands.append({"code": self._color_temp_dpcode, "value": device_temp})
+            _set(self._color_temp_dpcode, self._kelvin_to_temp(kelvin))
             if self._work_mode_dpcode:
-                commands.append({"code": self._work_mode_dpcode, "value": "white"})
+                _set(self._work_mode_dpcode, "white")
 
         # Handle HS color
         if ATTR_HS_COLOR in kwargs and self._color_data_dpcode:
@@ -269,29 +293,34 @@ class TrueXLightEntity(TrueXEntity, LightEntity):
                 "s": int((s / 100) * s_max),
                 "v": v_max,  # Full brightness in color mode
             }
-            commands.append(
-                {"code": self._color_data_dpcode, "value": json.dumps(color_value)}
-            )
+            # Reported colour data is stored decoded, so compare the dict
+            _set(self._color_data_dpcode, json_dumps(color_value), color_value)
             if self._work_mode_dpcode:
-                commands.append({"code": self._work_mode_dpcode, "value": "colour"})
+                _set(self._work_mode_dpcode, "colour")
 
         await self._send_commands(commands)
 
+    def _queue_command(
+        self,
+        commands: list[dict[str, Any]],
+        dpcode: str,
+        value: Any,
+        reported: Any = None,
+    ) -> None:
+        """Queue a command unless the device already reports the value.
+
+        ``reported`` is the value as it appears in status, when that
+        differs from the value sent in the command.
+        """
+        if reported is None:
+            reported = value
+        if self.device_obj.status.get(dpcode) == reported:
+            return
+        command = {"code": dpcode, "value": value}
+        if command not in commands:
+            commands.append(command)
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
         if self._switch_dpcode:
             await self._send_commands([{"code": self._switch_dpcode, "value": False}])
-
-    @staticmethod
-    def _scale(
-        value: float | int,
-        from_min: float,
-        from_max: float,
-        to_min: float,
-        to_max: float,
-    ) -> int:
-        """Scale a value from one range to another."""
-        if from_max == from_min:
-            return int(to_min)
-        scaled = (value - from_min) / (from_max - from_min) * (to_max - to_min) + to_min
-        return int(max(to_min, min(to_max, scaled)))
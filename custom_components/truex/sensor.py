@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
 
 from .truex_sharing import CustomerDevice, Manager
 
@@ -37,122 +40,115 @@ class TrueXSensorDescription(SensorEntityDescription):
     scale: float = 1.0  # Division factor for raw value
 
 
+# Descriptions shared by several device categories
+_TEMPERATURE = TrueXSensorDescription(
+    key="temperature",
+    dpcode=DPCode.VA_TEMPERATURE,
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    scale=10.0,
+)
+_CO2 = TrueXSensorDescription(
+    key="co2",
+    dpcode=DPCode.CO2_VALUE,
+    device_class=SensorDeviceClass.CO2,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement="ppm",
+)
+
 # Sensor definitions mapped by device category
-SENSORS: dict[str, list[TrueXSensorDescription]] = {
-    # Temperature and humidity sensor
-    DeviceCategory.WSDCG: [
-        TrueXSensorDescription(
-            key="temperature",
-            dpcode=DPCode.VA_TEMPERATURE,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            scale=10.0,
-        ),
-        TrueXSensorDescription(
-            key="humidity",
-            dpcode=DPCode.VA_HUMIDITY,
-            device_class=SensorDeviceClass.HUMIDITY,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=PERCENTAGE,
-            scale=10.0,
-        ),
-    ],
-    # Smart electricity meter
-    DeviceCategory.ZNDB: [
-        TrueXSensorDescription(
-            key="power",
-            dpcode=DPCode.CUR_POWER,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            scale=10.0,
-        ),
-        TrueXSensorDescription(
-            key="voltage",
-            dpcode=DPCode.CUR_VOLTAGE,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            scale=10.0,
-        ),
-        TrueXSensorDescription(
-            key="current",
-            dpcode=DPCode.CUR_CURRENT,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
-        ),
-        TrueXSensorDescription(
-            key="energy",
-            dpcode=DPCode.ADD_ELE,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            scale=100.0,
-        ),
-    ],
-    # CO2 detector
-    DeviceCategory.CO2BJ: [
-        TrueXSensorDescription(
-            key="co2",
-            dpcode=DPCode.CO2_VALUE,
-            device_class=SensorDeviceClass.CO2,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="ppm",
+SENSORS: Mapping[str, tuple[TrueXSensorDescription, ...]] = MappingProxyType(
+    {
+        # Temperature and humidity sensor
+        DeviceCategory.WSDCG: (
+            _TEMPERATURE,
+            TrueXSensorDescription(
+                key="humidity",
+                dpcode=DPCode.VA_HUMIDITY,
+                device_class=SensorDeviceClass.HUMIDITY,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=PERCENTAGE,
+                scale=10.0,
+            ),
         ),
-    ],
-    # Air quality monitor
-    DeviceCategory.HJJCY: [
-        TrueXSensorDescription(
-            key="pm25",
-            dpcode=DPCode.PM25_VALUE,
-            device_class=SensorDeviceClass.PM25,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="µg/m³",
+        # Smart electricity meter
+        DeviceCategory.ZNDB: (
+            TrueXSensorDescription(
+                key="power",
+                dpcode=DPCode.CUR_POWER,
+                device_class=SensorDeviceClass.POWER,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=UnitOfPower.WATT,
+                scale=10.0,
+            ),
+            TrueXSensorDescription(
+                key="voltage",
+                dpcode=DPCode.CUR_VOLTAGE,
+                device_class=SensorDeviceClass.VOLTAGE,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+                scale=10.0,
+            ),
+            TrueXSensorDescription(
+                key="current",
+                dpcode=DPCode.CUR_CURRENT,
+                device_class=SensorDeviceClass.CURRENT,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+            ),
+            TrueXSensorDescription(
+                key="energy",
+                dpcode=DPCode.ADD_ELE,
+                device_class=SensorDeviceClass.ENERGY,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+                scale=100.0,
+            ),
         ),
-        TrueXSensorDescription(
-            key="co2",
-            dpcode=DPCode.CO2_VALUE,
-            device_class=SensorDeviceClass.CO2,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="ppm",
+        # CO2 detector
+        DeviceCategory.CO2BJ: (
+            _CO2,
         ),
-        TrueXSensorDescription(
-            key="voc",
-            dpcode=DPCode.VOC_VALUE,
-            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="µg/m³",
+        # Air quality monitor
+        DeviceCategory.HJJCY: (
+            TrueXSensorDescription(
+                key="pm25",
+                dpcode=DPCode.PM25_VALUE,
+                device_class=SensorDeviceClass.PM25,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement="µg/m³",
+            ),
+            _CO2,
+            TrueXSensorDescription(
+                key="voc",
+                dpcode=DPCode.VOC_VALUE,
+                device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement="µg/m³",
+            ),
+            TrueXSensorDescription(
+                key="ch2o",
+                dpcode=DPCode.CH2O_VALUE,
+                device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement="mg/m³",
+                scale=100.0,
+            ),
+            _TEMPERATURE,
+            TrueXSensorDescription(
+                key="humidity",
+                dpcode=DPCode.VA_HUMIDITY,
+                device_class=SensorDeviceClass.HUMIDITY,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=PERCENTAGE,
+            ),
         ),
-        TrueXSensorDescription(
-            key="ch2o",
-            dpcode=DPCode.CH2O_VALUE,
-            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="mg/m³",
-            scale=100.0,
-        ),
-        TrueXSensorDescription(
-            key="temperature",
-            dpcode=DPCode.VA_TEMPERATURE,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            scale=10.0,
-        ),
-        TrueXSensorDescription(
-            key="humidity",
-            dpcode=DPCode.VA_HUMIDITY,
-            device_class=SensorDeviceClass.HUMIDITY,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=PERCENTAGE,
-        ),
-    ],
-}
+    }
+)
 
 # Generic sensors that apply to ANY device category if the dpcode exists
-GENERIC_SENSORS: list[TrueXSensorDescription] = [
+GENERIC_SENSORS: tuple[TrueXSensorDescription, ...] = (
     TrueXSensorDescription(
         key="battery",
         dpcode=DPCode.BATTERY_PERCENTAGE,
@@ -160,7 +156,12 @@ GENERIC_SENSORS: list[TrueXSensorDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
     ),
-]
+)
+
+
+def _supported_codes(device: CustomerDevice) -> set[str]:
+    """Return the DPCodes the device has a status or range for."""
+    return device.status.keys() | device.status_range.keys()
 
 
 async def async_setup_entry(
@@ -174,28 +175,16 @@ async def async_setup_entry(
     coordinator = truex_data.coordinator
 
     entities: list[TrueXSensorEntity] = []
-
     for device in manager.device_map.values():
-        # Category-specific sensors
-        if device.category in SENSORS:
-            for description in SENSORS[device.category]:
-                if (
-                    description.dpcode in device.status
-                    or description.dpcode in device.status_range
-                ):
-                    entities.append(
-                        TrueXSensorEntity(coordinator, device, manager, description)
-                    )
-
-        # Generic sensors (e.g., battery) for any device
-        for description in GENERIC_SENSORS:
-            if (
-                description.dpcode in device.status
-                or description.dpcode in device.status_range
-            ):
-                entities.append(
-                    TrueXSensorEntity(coordinator, device, manager, description)
-                )
+        supported = _supported_codes(device)
+        entities.extend(
+            TrueXSensorEntity(coordinator, device, manager, description)
+            # Category-specific sensors, then generic ones (e.g., battery)
+            for description in chain(
+                SENSORS.get(device.category, ()), GENERIC_SENSORS
+            )
+            if description.dpcode in supported
+        )
 
     LOGGER.debug("Setting up %d sensor entities", len(entities))
     async_add_entities(entities)
@@ -217,17 +206,20 @@ class TrueXSensorEntity(TrueXEntity, SensorEntity):
         super().__init__(coordinator, device, device_manager)
         self.entity_description = description
         self._attr_unique_id = f"truex.{device.id}.{description.key}"
+        self._dpcode = str(description.dpcode)
+        # None when the raw value is used as-is
+        self._scale = description.scale if description.scale != 1.0 else None
 
     @property
     def native_value(self) -> float | int | str | None:
         """Return the sensor value."""
-        value = self.device_obj.status.get(self.entity_description.dpcode)
+        value = self.device_obj.status.get(self._dpcode)
         if value is None:
             return None
         try:
             numeric = float(value)
-            if self.entity_description.scale != 1.0:
-                return round(numeric / self.entity_description.scale, 1)
-            return numeric
         except (ValueError, TypeError):
             return value
+        if self._scale is not None:
+            return round(numeric / self._scale, 1)
+        return numeric
@@ -16,15 +16,17 @@ from .const import DPCode, DeviceCategory, LOGGER
 from .entity import TrueXEntity
 
 # Categories that should produce switch entities
-SWITCH_CATEGORIES: set[str] = {
-    DeviceCategory.KG,      # Switch
-    DeviceCategory.CZ,      # Socket
-    DeviceCategory.PC,      # Power strip
-    DeviceCategory.DLQ,     # Circuit breaker
-}
+SWITCH_CATEGORIES: frozenset[str] = frozenset(
+    {
+        DeviceCategory.KG,      # Switch
+        DeviceCategory.CZ,      # Socket
+        DeviceCategory.PC,      # Power strip
+        DeviceCategory.DLQ,     # Circuit breaker
+    }
+)
 
 # DPCodes to look for, in priority order
-SWITCH_DPCODES: list[str] = [
+SWITCH_DPCODES: tuple[str, ...] = (
     DPCode.SWITCH_1,
     DPCode.SWITCH_2,
     DPCode.SWITCH_3,
@@ -34,7 +36,19 @@ SWITCH_DPCODES: list[str] = [
     DPCode.SWITCH_7,
     DPCode.SWITCH_8,
     DPCode.SWITCH,
-]
+)
+
+# Translation key and name of each numbered channel, keyed by dpcode
+_CHANNEL_NAMES: dict[str, tuple[str, str]] = {
+    str(dpcode): (str(dpcode), f"Switch {dpcode.removeprefix('switch_')}")
+    for dpcode in SWITCH_DPCODES
+    if dpcode != DPCode.SWITCH
+}
+
+
+def _supported_codes(device: CustomerDevice) -> set[str]:
+    """Return the DPCodes the device reports or accepts."""
+    return device.status.keys() | device.functions.keys()
 
 
 async def async_setup_entry(
@@ -48,17 +62,15 @@ async def async_setup_entry(
     coordinator = truex_data.coordinator
 
     entities: list[TrueXSwitchEntity] = []
-
-    for device in manager.device_map.values():
-        if device.category not in SWITCH_CATEGORIES:
-            continue
-
-        # Find which switch DPCodes this device supports
-        for dpcode in SWITCH_DPCODES:
-            if dpcode in device.status or dpcode in device.functions:
-                entities.append(
-                    TrueXSwitchEntity(coordinator, device, manager, dpcode)
-                )
+    for category in SWITCH_CATEGORIES:
+        for device in manager.devices_by_category.get(category, ()):
+            # Find which switch DPCodes this device supports
+            supported = _supported_codes(device)
+            entities.extend(
+                TrueXSwitchEntity(coordinator, device, manager, dpcode)
+                for dpcode in SWITCH_DPCODES
+                if dpcode in supported
+            )
 
     LOGGER.debug("Setting up %d switch entities", len(entities))
     async_add_entities(entities)
@@ -76,14 +88,12 @@ class TrueXSwitchEntity(TrueXEntity, SwitchEntity):
     ) -> None:
         """Init TrueX switch."""
         super().__init__(coordinator, device, device_manager)
-        self._dpcode = dpcode
+        self._dpcode = str(dpcode)
         # Make unique ID include the dpcode for multi-switch devices
         self._attr_unique_id = f"truex.{device.id}.{dpcode}"
         # Name suffix for multi-switch (e.g., "Switch 1", "Switch 2")
-        if dpcode != DPCode.SWITCH:
-            suffix = dpcode.replace("switch_", "")
-            self._attr_translation_key = f"switch_{suffix}"
-            self._attr_name = f"Switch {suffix}"
+        if (names := _CHANNEL_NAMES.get(self._dpcode)) is not None:
+            self._attr_translation_key, self._attr_name = names
 
     @property
     def is_on(self) -> bool | None:
@@ -8,23 +8,69 @@ Two signing modes:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
-import json
+import logging
+import re
 import time
 from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson ships with Home Assistant
+    import json
+
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes, like orjson.dumps."""
+        return json.dumps(
+            obj, separators=(",", ":")
+        ).encode("utf-8")
+
 from .customerlogging import logger
 
+# Connection pool shared by every request of a client
+_CONNECTOR_LIMIT = 20
+_KEEPALIVE_TIMEOUT = 60
+_DNS_CACHE_TTL = 300
+_REQUEST_TIMEOUT = 30
+
+# Business requests are spaced to stay within the API's per-second quota
+_MAX_REQUESTS_PER_SECOND = 20
+
+# Headers that are identical on every signed request
+_HEADERS_BASE = {
+    "sign_method": "HMAC-SHA256",
+    "Content-Type": "application/json",
+}
+
+# Query keys/values urlencode() would leave untouched
+_URL_SAFE = re.compile(r"[A-Za-z0-9_.~-]*")
+
 
 # ── Token Info ───────────────────────────────────────────────
 
 
 class TrueXTokenInfo:
-    """Token information for OPENAPI CUBE."""
+    """Token information for OPENAPI CUBE.
+
+    Only flat primitives are kept so to_dict() can be stored
+    in the config entry without further conversion.
+    """
+
+    __slots__ = (
+        "access_token",
+        "refresh_token",
+        "uid",
+        "expire_time",
+        "expire_at",
+        "refresh_at",
+    )
 
     def __init__(
         self,
@@ -52,14 +98,26 @@ class TrueXTokenInfo:
             self.uid = ""
             self.expire_time = 0
             self.expire_at = 0
+        self._update_refresh_deadline()
+
+    def _update_refresh_deadline(self) -> None:
+        """Derive when the token must be refreshed (60s buffer).
+
+        The wall-clock expiry is converted to the monotonic clock
+        once, so later clock adjustments do not affect it.
+        """
+        if not self.access_token:
+            self.refresh_at: float = float("-inf")
+            return
+        remaining_ms = (
+            self.expire_at - 60_000 - time.time_ns() // 1_000_000
+        )
+        self.refresh_at = time.monotonic() + remaining_ms / 1000
 
     @property
     def is_expired(self) -> bool:
         """Check if token is expired (60s buffer)."""
-        if not self.access_token:
-            return True
-        now_ms = int(time.time() * 1000)
-        return self.expire_at - 60_000 <= now_ms
+        return self.refresh_at <= time.monotonic()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize token info for config entry storage."""
@@ -86,11 +144,22 @@ class TrueXTokenInfo:
         info.uid = data.get("uid", "")
         info.expire_time = data.get("expire_time", 0)
         info.expire_at = data.get("expire_at", 0)
+        info._update_refresh_deadline()
         return info
 
 
 class TrueXAPIError(Exception):
-    """Exception raised for TrueX API errors."""
+    """Exception raised for TrueX API errors.
+
+    ``code`` holds the API error code, when the server sent one.
+    """
+
+    def __init__(
+        self, message: str, code: Any = None
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.code = code
 
 
 class SharingTokenListener:
@@ -104,37 +173,27 @@ class SharingTokenListener:
 
 # ── HMAC-SHA256 Signing ─────────────────────────────────────
 
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
 
 def _calc_sign(
-    client_id: str,
-    secret: str,
+    mac: hmac.HMAC,
     timestamp: str,
     nonce: str,
     sign_str: str,
-    access_token: str = "",
 ) -> str:
     """Calculate HMAC-SHA256 signature.
 
+    ``mac`` is keyed with the client secret and already fed
+    the mode's prefix; it is copied, so neither the key
+    schedule nor the prefix is redone per call.
+
     Token mode:    str = clientId + timestamp + nonce + signStr
     Business mode: str = clientId + accessToken + timestamp + nonce + signStr
     """
-    if access_token:
-        raw = (
-            client_id
-            + access_token
-            + timestamp
-            + nonce
-            + sign_str
-        )
-    else:
-        raw = (
-            client_id + timestamp + nonce + sign_str
-        )
-
-    h = hmac.new(
-        secret.encode("utf-8"),
-        raw.encode("utf-8"),
-        hashlib.sha256,
+    h = mac.copy()
+    h.update(
+        (timestamp + nonce + sign_str).encode("utf-8")
     )
     return h.hexdigest().upper()
 
@@ -143,19 +202,25 @@ def _string_to_sign(
     method: str,
     path: str,
     query: dict[str, Any] | None = None,
-    body: str = "",
-) -> str:
+    body: bytes = b"",
+) -> tuple[str, str]:
     """Build the string-to-sign per Tuya OPENAPI spec.
 
     Format: METHOD\nSHA256(body)\nheaders_str\nurl
+
+    The sorted query string is returned alongside it so
+    callers can reuse it for the request URL.
     """
-    # SHA-256 of body content
-    body_hash = hashlib.sha256(
-        body.encode("utf-8")
-    ).hexdigest()
+    # SHA-256 of body content (constant for the bodiless GETs)
+    body_hash = (
+        hashlib.sha256(body).hexdigest()
+        if body
+        else _EMPTY_SHA256
+    )
 
     # Build sorted query string
     url = path
+    qs = ""
     if query:
         sorted_keys = sorted(query.keys())
         qs = "&".join(
@@ -163,10 +228,25 @@ def _string_to_sign(
         )
         url = f"{path}?{qs}"
 
-    # No custom signature headers
-    headers_str = ""
+    # No custom signature headers, so that line is always empty
+    return f"{method}\n{body_hash}\n\n{url}", qs
+
+
+def _query_string(
+    query: dict[str, Any], canonical_qs: str
+) -> str:
+    """Return the URL query string for the request.
 
-    return f"{method}\n{body_hash}\n{headers_str}\n{url}"
+    The signed canonical string is used as-is when no key or
+    value needs escaping; otherwise fall back to urlencode.
+    """
+    for key, value in query.items():
+        if not (
+            _URL_SAFE.fullmatch(f"{key}")
+            and _URL_SAFE.fullmatch(f"{value}")
+        ):
+            return urlencode(query)
+    return canonical_qs
 
 
 # ── Main API Client ─────────────────────────────────────────
@@ -191,6 +271,18 @@ class CustomerApi:
         self.api_url = api_url.rstrip("/")
         self.client_id = client_id
         self.secret = secret
+        self._headers_template = {
+            **_HEADERS_BASE,
+            "client_id": client_id,
+        }
+        # Token-mode signing state: keyed, fed the client_id
+        self._token_mac = hmac.new(
+            secret.encode("utf-8"), digestmod=hashlib.sha256
+        )
+        self._token_mac.update(client_id.encode("utf-8"))
+        # Business-mode state, rebuilt when the token changes
+        self._business_mac = self._token_mac
+        self._business_mac_token: str | None = None
         self.schema = schema
         self.token_info = TrueXTokenInfo()
         self.token_listener: (
@@ -198,20 +290,76 @@ class CustomerApi:
         ) = None
         self._session = session
         self._owns_session = session is None
-        self._refreshing_token = False
+        self._token_lock = asyncio.Lock()
+        # Monotonic time from which the next request may be sent
+        self._next_request_at = 0.0
 
     async def _ensure_session(
         self,
     ) -> aiohttp.ClientSession:
-        """Ensure an aiohttp session exists."""
+        """Ensure an aiohttp session exists.
+
+        The session keeps its TCP/TLS connections alive so
+        consecutive polls reuse them instead of handshaking
+        again on every request.
+        """
         if (
             self._session is None
             or self._session.closed
         ):
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_CONNECTOR_LIMIT,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=_DNS_CACHE_TTL,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=_REQUEST_TIMEOUT
+                ),
+            )
             self._owns_session = True
         return self._session
 
+    def _business_sign_mac(self) -> hmac.HMAC:
+        """Return the HMAC fed clientId + accessToken.
+
+        Rebuilt only when the access token differs from the
+        one it was built for, which also covers token_info
+        being replaced from outside the client.
+        """
+        access_token = self.token_info.access_token
+        if access_token != self._business_mac_token:
+            mac = self._token_mac.copy()
+            mac.update(access_token.encode("utf-8"))
+            self._business_mac = mac
+            self._business_mac_token = access_token
+        return self._business_mac
+
+    def _sign_request(
+        self,
+        mac: hmac.HMAC,
+        method: str,
+        path: str,
+        query: dict[str, Any] | None = None,
+        body: bytes = b"",
+    ) -> tuple[dict[str, str], str]:
+        """Sign a request stamped with the current time.
+
+        Returns the request headers and the canonical query
+        string that was signed.
+        """
+        timestamp = f"{time.time_ns() // 1_000_000}"
+        sign_str, canonical_qs = _string_to_sign(
+            method, path, query, body
+        )
+        headers = self._headers_template | {
+            "sign": _calc_sign(
+                mac, timestamp, "", sign_str
+            ),
+            "t": timestamp,
+        }
+        return headers, canonical_qs
+
     async def close(self) -> None:
         """Close the session if we own it."""
         if (
@@ -230,40 +378,27 @@ class CustomerApi:
         """
         path = "/v1.0/token"
         query_params = {"grant_type": "1"}
-        timestamp = str(int(time.time() * 1000))
-
-        sign_str = _string_to_sign(
-            "GET", path, query_params
-        )
-        sign = _calc_sign(
-            self.client_id,
-            self.secret,
-            timestamp,
-            "",
-            sign_str,
+        headers, canonical_qs = self._sign_request(
+            self._token_mac, "GET", path, query_params
         )
 
-        headers = {
-            "client_id": self.client_id,
-            "sign": sign,
-            "t": timestamp,
-            "sign_method": "HMAC-SHA256",
-            "Content-Type": "application/json",
-        }
-
         session = await self._ensure_session()
         url = (
             f"{self.api_url}{path}"
-            f"?{urlencode(query_params)}"
+            f"?{_query_string(query_params, canonical_qs)}"
         )
-        logger.debug("Getting access token from %s", url)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Getting access token from %s", url)
 
         async with session.get(
             url, headers=headers
         ) as resp:
-            response = await resp.json()
+            raw = await resp.read()
+        response = json_loads(raw)
 
-        logger.debug("Token response: %s", response)
+        if debug:
+            logger.debug("Token response: %s", response)
 
         if response.get("success"):
             result = response.get("result", {})
@@ -294,40 +429,28 @@ class CustomerApi:
         )
 
     async def _refresh_access_token(self) -> None:
-        """Refresh the access token."""
-        if self._refreshing_token:
-            return
-        self._refreshing_token = True
+        """Refresh the access token.
+
+        Callers hold _token_lock, so concurrent requests wait
+        for this refresh and then use the new token.
+        """
         try:
             path = (
                 "/v1.0/token/"
                 + self.token_info.refresh_token
             )
-            timestamp = str(int(time.time() * 1000))
-            sign_str = _string_to_sign("GET", path)
-            sign = _calc_sign(
-                self.client_id,
-                self.secret,
-                timestamp,
-                "",
-                sign_str,
+            headers, _ = self._sign_request(
+                self._token_mac, "GET", path
             )
 
-            headers = {
-                "client_id": self.client_id,
-                "sign": sign,
-                "t": timestamp,
-                "sign_method": "HMAC-SHA256",
-                "Content-Type": "application/json",
-            }
-
             session = await self._ensure_session()
             url = f"{self.api_url}{path}"
 
             async with session.get(
                 url, headers=headers
             ) as resp:
-                response = await resp.json()
+                raw = await resp.read()
+            response = json_loads(raw)
 
             if response.get("success"):
                 result = response.get("result", {})
@@ -359,12 +482,18 @@ class CustomerApi:
         except Exception:
             logger.exception("Error refreshing token")
             await self.get_access_token()
-        finally:
-            self._refreshing_token = False
 
     async def _ensure_token(self) -> None:
-        """Ensure we have a valid (non-expired) token."""
-        if self.token_info.is_expired:
+        """Ensure we have a valid (non-expired) token.
+
+        Concurrent callers that find the token expired wait on
+        the same lock, so only one of them refreshes it.
+        """
+        if not self.token_info.is_expired:
+            return
+        async with self._token_lock:
+            if not self.token_info.is_expired:
+                return
             if self.token_info.refresh_token:
                 await self._refresh_access_token()
             else:
@@ -372,6 +501,20 @@ class CustomerApi:
 
     # ── Authenticated Request ───────────────────────────
 
+    async def _throttle(self) -> None:
+        """Wait for this request's slot under the rate limit.
+
+        Slots are reserved before sleeping, so concurrent callers
+        are spread out evenly instead of all waking at once.
+        """
+        now = time.monotonic()
+        start = max(now, self._next_request_at)
+        self._next_request_at = (
+            start + 1 / _MAX_REQUESTS_PER_SECOND
+        )
+        if start > now:
+            await asyncio.sleep(start - now)
+
     async def request(
         self,
         method: str,
@@ -382,51 +525,39 @@ class CustomerApi:
         """Make an authenticated business API request.
 
         Uses business-mode signing that includes
-        access_token in the HMAC string.
+        access_token in the HMAC string. A non-2xx HTTP
+        response yields {"success": False, "http_status": ...}.
         """
+        await self._throttle()
         await self._ensure_token()
 
-        timestamp = str(int(time.time() * 1000))
-        body_str = (
-            json.dumps(body) if body else ""
+        # Serialize once; the same bytes are signed and sent
+        body_bytes = json_dumps(body) if body else b""
+        headers, canonical_qs = self._sign_request(
+            self._business_sign_mac(),
+            method,
+            path,
+            params,
+            body_bytes,
         )
-        sign_str = _string_to_sign(
-            method, path, params, body_str
-        )
-        sign = _calc_sign(
-            self.client_id,
-            self.secret,
-            timestamp,
-            "",
-            sign_str,
-            access_token=(
-                self.token_info.access_token
-            ),
+        headers["access_token"] = (
+            self.token_info.access_token
         )
 
-        headers = {
-            "client_id": self.client_id,
-            "access_token": (
-                self.token_info.access_token
-            ),
-            "sign": sign,
-            "t": timestamp,
-            "sign_method": "HMAC-SHA256",
-            "Content-Type": "application/json",
-        }
-
         session = await self._ensure_session()
         url = f"{self.api_url}{path}"
         if params:
-            url += f"?{urlencode(params)}"
+            url += f"?{_query_string(params, canonical_qs)}"
 
-        logger.debug(
-            "API %s %s body=%s", method, url, body_str
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "API %s %s body=%s", method, url, body_bytes
+            )
 
         kwargs: dict[str, Any] = {"headers": headers}
         if body:
-            kwargs["json"] = body
+            kwargs["data"] = body_bytes
 
         async with session.request(
             method, url, **kwargs
@@ -438,10 +569,15 @@ class CustomerApi:
                     resp.status,
                     text,
                 )
-                return {"success": False}
-            response = await resp.json()
+                return {
+                    "success": False,
+                    "http_status": resp.status,
+                }
+            raw = await resp.read()
+        response = json_loads(raw)
 
-        logger.debug("API response: %s", response)
+        if debug:
+            logger.debug("API response: %s", response)
 
         if not response.get("success"):
             code = response.get("code", "N/A")
@@ -450,7 +586,8 @@ class CustomerApi:
                 "API error: %s (code: %s)", msg, code
             )
             raise TrueXAPIError(
-                f"API error: {msg} (code: {code})"
+                f"API error: {msg} (code: {code})",
+                code,
             )
 
         return response
@@ -554,6 +691,19 @@ class CustomerApi:
             f"/v1.0/devices/{device_id}/status"
         )
 
+    async def get_devices_status(
+        self, device_ids: list[str]
+    ) -> dict[str, Any]:
+        """Get latest status for several devices at once.
+
+        GET /v1.0/devices/status?device_ids=id1,id2,...
+        Result: [{"id": "...", "status": [{"code": "...", "value": ...}]}]
+        """
+        return await self.get(
+            "/v1.0/devices/status",
+            {"device_ids": ",".join(device_ids)},
+        )
+
     async def get_device_specifications(
         self, device_id: str
     ) -> dict[str, Any]:
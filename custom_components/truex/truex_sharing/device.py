@@ -6,28 +6,24 @@ Equivalent to tuya_sharing.device.CustomerDevice.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypedDict
 
 
-@dataclass
-class DeviceFunction:
-    """Device function specification."""
+class DeviceFunction(TypedDict):
+    """Device function specification, keyed by code in functions."""
 
-    code: str = ""
-    type: str = ""
-    values: dict[str, Any] = field(default_factory=dict)
+    type: str
+    values: dict[str, Any]
 
 
-@dataclass
-class DeviceStatusRange:
-    """Device status range specification."""
+class DeviceStatusRange(TypedDict):
+    """Device status range specification, keyed by code in status_range."""
 
-    code: str = ""
-    type: str = ""
-    values: dict[str, Any] = field(default_factory=dict)
+    type: str
+    values: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerDevice:
     """Representation of a TrueX/Tuya device.
 
@@ -52,8 +48,11 @@ class CustomerDevice:
 
     # Runtime data populated after fetching
     status: dict[str, Any] = field(default_factory=dict)
-    functions: dict[str, dict[str, Any]] = field(default_factory=dict)
-    status_range: dict[str, dict[str, Any]] = field(default_factory=dict)
+    functions: dict[str, DeviceFunction] = field(default_factory=dict)
+    status_range: dict[str, DeviceStatusRange] = field(default_factory=dict)
+
+    # Bumped whenever status is updated, so readers can cache derived values
+    status_version: int = 0
 
     # Flag to indicate entity setup is complete
     set_up: bool = False
@@ -61,20 +60,24 @@ class CustomerDevice:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> CustomerDevice:
         """Create a CustomerDevice from API response data."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            category=data.get("category", ""),
-            product_id=data.get("product_id", ""),
-            product_name=data.get("product_name", ""),
-            online=data.get("online", False),
-            icon=data.get("icon", ""),
-            ip=data.get("ip", ""),
-            time_zone=data.get("time_zone", ""),
-            local_key=data.get("local_key", ""),
-            sub=data.get("sub", False),
-            uuid=data.get("uuid", ""),
-            active_time=data.get("active_time", 0),
-            create_time=data.get("create_time", 0),
-            update_time=data.get("update_time", 0),
-        )
+        return cls(**{key: data.get(key, default) for key, default in _FIELD_DEFAULTS})
+
+
+# API response fields copied onto CustomerDevice, with their defaults
+_FIELD_DEFAULTS: tuple[tuple[str, Any], ...] = (
+    ("id", ""),
+    ("name", ""),
+    ("category", ""),
+    ("product_id", ""),
+    ("product_name", ""),
+    ("online", False),
+    ("icon", ""),
+    ("ip", ""),
+    ("time_zone", ""),
+    ("local_key", ""),
+    ("sub", False),
+    ("uuid", ""),
+    ("active_time", 0),
+    ("create_time", 0),
+    ("update_time", 0),
+)
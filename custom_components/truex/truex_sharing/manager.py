@@ -5,13 +5,66 @@ Equivalent to tuya_sharing.manager.Manager.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable, Container, Iterable
 from typing import Any
 
-from .customerapi import CustomerApi
+from .customerapi import CustomerApi, TrueXAPIError, json_loads
 from .customerlogging import logger
 from .device import CustomerDevice
 
+# Upper bound on per-device requests in flight, to stay under API rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Devices per bulk status request
+STATUS_BATCH_SIZE = 20
+
+# API error codes meaning an endpoint is not available to this project
+# (1106: permission denied, 1108: URI path invalid)
+UNSUPPORTED_ENDPOINT_CODES = frozenset({1106, 1108})
+
+# Seconds before cached product specifications are fetched again, so
+# functions added by firmware updates are picked up
+SPEC_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Specification value keys that hold numbers
+NUMERIC_SPEC_KEYS = ("min", "max", "step", "scale")
+
+# Status codes whose values are reported as JSON strings
+JSON_DPCODES = frozenset({"colour_data", "colour_data_v2"})
+
+
+def _parse_spec_values(values: Any) -> dict[str, Any]:
+    """Decode a specification "values" field into a canonical dict.
+
+    Numeric range keys are coerced to numbers here so entities can use
+    them without further checks: integral values become ints, fractional
+    ones stay floats, and keys that are not numeric are dropped.
+    """
+    if isinstance(values, str):
+        try:
+            values = json_loads(values)
+        except ValueError:
+            return {}
+    if not isinstance(values, dict):
+        return {}
+    for key in NUMERIC_SPEC_KEYS:
+        if key in values:
+            try:
+                number = float(values[key])
+            except (ValueError, TypeError):
+                del values[key]
+                continue
+            if number.is_integer():
+                values[key] = int(number)
+            elif math.isfinite(number):
+                values[key] = number
+            else:
+                del values[key]
+    return values
+
 
 class DeviceListener:
     """Listener for device update events."""
@@ -32,19 +85,50 @@ class Manager:
     Equivalent to tuya_sharing.manager.Manager.
     """
 
-    def __init__(self, api: CustomerApi, uid: str) -> None:
-        """Initialize the device manager."""
+    def __init__(
+        self,
+        api: CustomerApi,
+        uid: str,
+        spec_cache: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize the device manager.
+
+        ``spec_cache`` maps product IDs to previously fetched
+        specifications ({"functions": ..., "status_range": ...}).
+        It is filled in as products are fetched, each entry stamped
+        with its "fetched_at" time, and ``spec_cache_changed`` is set
+        so the caller knows to persist it.
+        """
         self.api = api
         self.uid = uid
+        self.spec_cache: dict[str, dict[str, Any]] = (
+            spec_cache if spec_cache is not None else {}
+        )
+        self.spec_cache_changed = False
         self.device_map: dict[str, CustomerDevice] = {}
+        self.devices_by_category: dict[str, list[CustomerDevice]] = {}
         self.device_listeners: list[DeviceListener] = []
+        self._bulk_status_supported = True
+        # device_id -> (queued commands, result shared by their senders)
+        self._pending_commands: dict[
+            str, tuple[list[dict[str, Any]], asyncio.Future[bool]]
+        ] = {}
+        # device_id -> timer that starts the device's next refresh
+        self._pending_refreshes: dict[str, asyncio.TimerHandle] = {}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
 
     def add_device_listener(self, listener: DeviceListener) -> None:
         """Register a device listener."""
         self.device_listeners.append(listener)
 
-    async def update_device_cache(self) -> None:
-        """Fetch all devices for the user and populate the device map."""
+    async def update_device_cache(
+        self, categories: Container[str] | None = None
+    ) -> None:
+        """Fetch all devices for the user and populate the device map.
+
+        When ``categories`` is given, specifications are only fetched
+        for devices in those categories.
+        """
         response = await self.api.get_user_devices(self.uid)
         if not response.get("success"):
             logger.error("Failed to get devices: %s", response)
@@ -61,27 +145,80 @@ class Manager:
             device = CustomerDevice.from_api_response(dev_data)
 
             # Parse status from the device list response
-            status_list = dev_data.get("status", [])
-            for status_item in status_list:
-                code = status_item.get("code", "")
-                value = status_item.get("value")
-                if code:
-                    device.status[code] = value
+            self._store_status(device, dev_data.get("status", []))
 
             self.device_map[device_id] = device
 
-        # Fetch specifications for each device
-        for device_id, device in self.device_map.items():
-            await self._fetch_device_specifications(device)
+        # Index devices by category so platforms only visit their own
+        devices_by_category: dict[str, list[CustomerDevice]] = {}
+        for device in self.device_map.values():
+            devices_by_category.setdefault(device.category, []).append(device)
+        self.devices_by_category = devices_by_category
+
+        # Fetch specifications concurrently, skipping unhandled categories.
+        # Only one device per product is fetched from the API; the others
+        # then find that product's specifications in the cache.
+        first_of_product: dict[str, CustomerDevice] = {}
+        same_product: list[CustomerDevice] = []
+        for device in self.device_map.values():
+            if categories is not None and device.category not in categories:
+                continue
+            key = device.product_id or device.id
+            if key in first_of_product:
+                same_product.append(device)
+            else:
+                first_of_product[key] = device
+        for devices in (first_of_product.values(), same_product):
+            await self._gather_per_device(
+                self._fetch_device_specifications, devices
+            )
+
+    async def _gather_per_device(
+        self,
+        func: Callable[[CustomerDevice], Awaitable[None]],
+        devices: Iterable[CustomerDevice] | None = None,
+    ) -> None:
+        """Run a per-device coroutine for each device, bounded in parallel.
+
+        Defaults to every device in the device map.
+        """
+        if devices is None:
+            devices = self.device_map.values()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _guarded(device: CustomerDevice) -> None:
+            async with semaphore:
+                await func(device)
+
+        await asyncio.gather(
+            *(_guarded(device) for device in devices),
+            return_exceptions=True,
+        )
 
     async def _fetch_device_specifications(self, device: CustomerDevice) -> None:
-        """Fetch and store device specifications (functions and status range)."""
+        """Fetch and store device specifications (functions and status range).
+
+        Specifications are per product, so a cached copy for the
+        device's product ID is used instead of calling the API until
+        it is older than SPEC_CACHE_MAX_AGE. A stale copy is still
+        used if fetching fails.
+        """
+        cached = self.spec_cache.get(device.product_id)
+        if (
+            cached is not None
+            and time.time() - cached.get("fetched_at", 0) < SPEC_CACHE_MAX_AGE
+        ):
+            self._apply_cached_specs(device, cached)
+            return
+
         try:
             response = await self.api.get_device_specifications(device.id)
             if not response.get("success"):
                 logger.debug(
                     "No specifications for device %s: %s", device.id, response
                 )
+                if cached is not None:
+                    self._apply_cached_specs(device, cached)
                 return
 
             result = response.get("result", {})
@@ -90,67 +227,247 @@ class Manager:
             for func in result.get("functions", []):
                 code = func.get("code", "")
                 if code:
-                    values = func.get("values", "{}")
-                    try:
-                        parsed_values = (
-                            json.loads(values)
-                            if isinstance(values, str)
-                            else values
-                        )
-                    except (json.JSONDecodeError, TypeError):
-                        parsed_values = {}
                     device.functions[code] = {
                         "type": func.get("type", ""),
-                        "values": parsed_values,
+                        "values": _parse_spec_values(func.get("values", "{}")),
                     }
 
             # Parse status range
             for sr in result.get("status", []):
                 code = sr.get("code", "")
                 if code:
-                    values = sr.get("values", "{}")
-                    try:
-                        parsed_values = (
-                            json.loads(values)
-                            if isinstance(values, str)
-                            else values
-                        )
-                    except (json.JSONDecodeError, TypeError):
-                        parsed_values = {}
                     device.status_range[code] = {
                         "type": sr.get("type", ""),
-                        "values": parsed_values,
+                        "values": _parse_spec_values(sr.get("values", "{}")),
                     }
 
+            if device.product_id:
+                self.spec_cache[device.product_id] = {
+                    "functions": device.functions,
+                    "status_range": device.status_range,
+                    "fetched_at": int(time.time()),
+                }
+                self.spec_cache_changed = True
+
         except Exception:
             logger.exception("Error fetching specifications for %s", device.id)
+            if cached is not None:
+                device.functions.clear()
+                device.status_range.clear()
+                self._apply_cached_specs(device, cached)
+
+    @staticmethod
+    def _apply_cached_specs(
+        device: CustomerDevice, cached: dict[str, Any]
+    ) -> None:
+        """Copy a cached product specification onto a device."""
+        device.functions.update(cached["functions"])
+        device.status_range.update(cached["status_range"])
 
     async def update_device_status(self) -> None:
-        """Poll status updates for all devices."""
-        for device_id, device in self.device_map.items():
-            try:
-                response = await self.api.get_device_status(device_id)
-                if response.get("success"):
-                    status_list = response.get("result", [])
-                    for status_item in status_list:
-                        code = status_item.get("code", "")
-                        value = status_item.get("value")
-                        if code:
-                            device.status[code] = value
-                    # Notify listeners
-                    for listener in self.device_listeners:
-                        listener.update_device(device)
-                else:
+        """Poll status updates for all devices.
+
+        Devices are polled in batches through the bulk status
+        endpoint. Devices missing from a batch response, or all of
+        them once the server answers 404 for the bulk endpoint, are
+        polled with concurrent per-device requests. Batches hit by
+        a transient HTTP error are retried on the next poll.
+        """
+        pending: list[CustomerDevice] = list(self.device_map.values())
+        if self._bulk_status_supported and pending:
+            device_ids = list(self.device_map)
+            batches = [
+                device_ids[i : i + STATUS_BATCH_SIZE]
+                for i in range(0, len(device_ids), STATUS_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(self._update_status_batch(batch) for batch in batches)
+            )
+            pending = [
+                self.device_map[device_id]
+                for missing in results
+                for device_id in missing
+            ]
+        if pending:
+            await self._gather_per_device(
+                self._update_single_device_status, pending
+            )
+
+    async def _update_status_batch(self, device_ids: list[str]) -> list[str]:
+        """Poll one batch through the bulk endpoint.
+
+        Returns the IDs of devices whose status was not updated.
+        """
+        try:
+            response = await self.api.get_devices_status(device_ids)
+        except TrueXAPIError as err:
+            if err.code in UNSUPPORTED_ENDPOINT_CODES:
+                # The server has no bulk endpoint; poll per device from now on
+                logger.debug(
+                    "Bulk status endpoint unsupported, polling per device: %s",
+                    err,
+                )
+                self._bulk_status_supported = False
+            else:
+                logger.debug("Bulk status request failed: %s", err)
+            return device_ids
+        except Exception as err:
+            logger.debug("Bulk status request failed: %s", err)
+            return device_ids
+
+        if not response.get("success"):
+            if response.get("http_status") == 404:
+                # The server has no bulk endpoint; poll per device from now on
+                logger.debug(
+                    "Bulk status endpoint not found, polling per device: %s",
+                    response,
+                )
+                self._bulk_status_supported = False
+                return device_ids
+            # Transient HTTP failure (rate limit, server error): retry the
+            # bulk endpoint on the next poll rather than fanning out now
+            logger.debug("Bulk status request failed: %s", response)
+            return []
+
+        updated: set[str] = set()
+        for item in response.get("result", []):
+            device = self.device_map.get(item.get("id", ""))
+            if device is None:
+                continue
+            self._apply_status(device, item.get("status", []))
+            updated.add(device.id)
+        return [
+            device_id for device_id in device_ids if device_id not in updated
+        ]
+
+    @staticmethod
+    def _store_status(
+        device: CustomerDevice, status_list: list[dict[str, Any]]
+    ) -> None:
+        """Store reported status codes on a device.
+
+        JSON-encoded values are decoded once here so entities
+        can read them as dicts.
+        """
+        # Runs for every code of every device on each poll; build the
+        # updates in one comprehension and apply them with one update()
+        updates = {
+            code: status_item.get("value")
+            for status_item in status_list
+            if (code := status_item.get("code"))
+        }
+        for code in JSON_DPCODES.intersection(updates):
+            value = updates[code]
+            if isinstance(value, str):
+                try:
+                    updates[code] = json_loads(value)
+                except ValueError:
                     logger.debug(
-                        "Failed to update status for %s: %s", device_id, response
+                        "Invalid JSON for %s on %s: %s", code, device.id, value
                     )
-            except Exception:
-                logger.exception("Error updating status for %s", device_id)
+        device.status.update(updates)
+
+    def _apply_status(
+        self, device: CustomerDevice, status_list: list[dict[str, Any]]
+    ) -> None:
+        """Store reported status codes on a device and notify listeners."""
+        self._store_status(device, status_list)
+        device.status_version += 1
+        # Notify listeners
+        for listener in self.device_listeners:
+            listener.update_device(device)
+
+    def schedule_refresh(
+        self,
+        device_id: str,
+        delay: float,
+        on_refreshed: Callable[[], None] | None = None,
+    ) -> None:
+        """Poll the latest status of a single device after a quiet period.
+
+        The poll starts ``delay`` seconds after the latest call for the
+        device; calls made meanwhile (a slider being dragged, a scene
+        switching every channel) restart the wait and share one status
+        request. ``on_refreshed`` is called once the new status is applied.
+        """
+        if device_id not in self.device_map:
+            return
+        if (previous := self._pending_refreshes.get(device_id)) is not None:
+            previous.cancel()
+        self._pending_refreshes[device_id] = asyncio.get_running_loop().call_later(
+            delay, self._start_refresh, device_id, on_refreshed
+        )
+
+    def _start_refresh(
+        self, device_id: str, on_refreshed: Callable[[], None] | None
+    ) -> None:
+        """Run the refresh scheduled for a device."""
+        del self._pending_refreshes[device_id]
+        device = self.device_map[device_id]
+
+        async def _refresh() -> None:
+            await self._update_single_device_status(device)
+            if on_refreshed is not None:
+                on_refreshed()
+
+        task = asyncio.get_running_loop().create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def cancel_refreshes(self) -> None:
+        """Cancel scheduled and running device refreshes."""
+        for handle in self._pending_refreshes.values():
+            handle.cancel()
+        self._pending_refreshes.clear()
+        for task in self._refresh_tasks:
+            task.cancel()
+
+    async def _update_single_device_status(self, device: CustomerDevice) -> None:
+        """Poll and apply the latest status of one device."""
+        device_id = device.id
+        try:
+            response = await self.api.get_device_status(device_id)
+            if response.get("success"):
+                self._apply_status(device, response.get("result", []))
+            else:
+                logger.debug(
+                    "Failed to update status for %s: %s", device_id, response
+                )
+        except Exception:
+            logger.exception("Error updating status for %s", device_id)
 
     async def send_commands(
         self, device_id: str, commands: list[dict[str, Any]]
     ) -> bool:
-        """Send commands to a device."""
+        """Send commands to a device.
+
+        Commands for the same device issued within one event loop
+        iteration (e.g. a scene switching every channel of a power
+        strip) are sent together in a single request, in call order.
+        """
+        if (batch := self._pending_commands.get(device_id)) is not None:
+            batch[0].extend(commands)
+            return await asyncio.shield(batch[1])
+
+        batch = (list(commands), asyncio.get_running_loop().create_future())
+        self._pending_commands[device_id] = batch
+        result = False
+        try:
+            # Let other senders scheduled in this iteration join the batch
+            await asyncio.sleep(0)
+            if self._pending_commands.get(device_id) is batch:
+                del self._pending_commands[device_id]
+            result = await self._post_commands(device_id, batch[0])
+        finally:
+            if self._pending_commands.get(device_id) is batch:
+                del self._pending_commands[device_id]
+            batch[1].set_result(result)
+        return result
+
+    async def _post_commands(
+        self, device_id: str, commands: list[dict[str, Any]]
+    ) -> bool:
+        """Send one batch of commands to a device."""
         try:
             response = await self.api.send_device_commands(device_id, commands)
             if response.get("success"):